@@ -442,6 +442,9 @@ class Datasette:
         self.inspect_data = inspect_data
         self.immutables = set(immutables or [])
         self.databases = collections.OrderedDict()
+        # Lazily built route -> Database cache, see get_database()
+        self._databases_by_route = None
+        self._databases_by_route_source = None
         self.actions = {}  # .invoke_startup() will populate this
         self._column_types = {}  # .invoke_startup() will populate this
         try:
@@ -915,14 +918,34 @@ class Datasette:
 
     def get_database(self, name=None, route=None):
         if route is not None:
-            matches = [db for db in self.databases.values() if db.route == route]
-            if not matches:
-                raise KeyError
-            return matches[0]
+            # Routes are resolved on every request, so cache the lookup
+            # dict. add_database()/remove_database() replace self.databases
+            # with a new dict rather than mutating it, which is what
+            # invalidates this cache.
+            databases = self.databases
+            if self._databases_by_route_source is not databases:
+                self._build_databases_by_route(databases)
+            try:
+                db = self._databases_by_route[route]
+                if db.route == route:
+                    return db
+            except KeyError:
+                pass
+            # Code can also assign db.route directly on a registered
+            # database, which this cache cannot see - rebuild once
+            # before giving up
+            self._build_databases_by_route(databases)
+            return self._databases_by_route[route]
         if name is None:
             name = [key for key in self.databases.keys()][0]
         return self.databases[name]
 
+    def _build_databases_by_route(self, databases):
+        # reversed() so the first database with a route wins, matching
+        # the previous linear scan
+        self._databases_by_route = {db.route: db for db in reversed(databases.values())}
+        self._databases_by_route_source = databases
+
     def add_database(self, db, name=None, route=None):
         new_databases = self.databases.copy()
         if name is None:
@@ -2334,6 +2357,29 @@ class Datasette:
                 renderer.get("can_render") or (lambda: True),
             )
 
+    def _select_template(self, environment, templates):
+        # Like environment.select_template() but caches which template name
+        # was resolved for each list of candidates. select_template() raises
+        # and catches TemplateNotFound for every missing candidate (for
+        # example table-database-table.html) on every render, which shows up
+        # on page-heavy workloads. The cache stores names, not Template
+        # objects, so Jinja's own auto-reload logic still picks up changes
+        # to template file contents. Adding a brand new higher-priority
+        # template file requires a restart.
+        if isinstance(templates, str):
+            templates = [templates]
+        key = tuple(templates)
+        try:
+            cache = environment._datasette_selected_templates
+        except AttributeError:
+            cache = environment._datasette_selected_templates = {}
+        name = cache.get(key)
+        if name is not None:
+            return environment.get_template(name)
+        template = environment.select_template(templates)
+        cache[key] = template.name
+        return template
+
     async def render_template(
         self,
         templates: List[str] | str | Template,
@@ -2347,9 +2393,9 @@ class Datasette:
         if isinstance(templates, Template):
             template = templates
         else:
-            if isinstance(templates, str):
-                templates = [templates]
-            template = self.get_jinja_environment(request).select_template(templates)
+            template = self._select_template(
+                self.get_jinja_environment(request), templates
+            )
         if dataclasses.is_dataclass(context):
             # Shallow conversion - asdict() would deep-copy values, which
             # is wasteful and fails on values like sqlite3.Row
@@ -29,8 +29,6 @@ from .utils.sql_analysis import SQLAnalysis, analyze_sql_tables
 from .utils.sqlite import sqlite_hidden_table_names
 from .inspect import inspect_hash
 
-connections = threading.local()
-
 EXECUTE_WRITE_RETURNING_LIMIT = 10
 
 AttachedDatabase = namedtuple("AttachedDatabase", ("seq", "name", "file"))
@@ -46,7 +44,6 @@ _SHUTDOWN = object()
 class Database:
     # For table counts stop at this many rows:
     count_limit = 10000
-    _thread_local_id_counter = 1
 
     def __init__(
         self,
@@ -59,8 +56,6 @@ class Database:
         is_temp_disk=False,
     ):
         self.name = None
-        self._thread_local_id = f"x{self._thread_local_id_counter}"
-        Database._thread_local_id_counter += 1
         self.route = None
         self.ds = ds
         self.path = path
@@ -82,12 +77,18 @@ class Database:
             self._wal_enabled = False
         self.cached_hash = None
         self.cached_size = None
+        self.cached_color = None
+        # Pool of prepared read-only connections, shared between the read
+        # worker threads. Its size is bounded by the number of workers
+        # (num_sql_threads).
+        self._read_pool = queue.Queue()
         self._cached_table_counts = None
         self._write_thread = None
         self._write_queue = None
+        self._read_threads = []
+        self._read_queue = None
         self._closed = False
-        self._pending_execute_futures = set()
-        self._pending_execute_futures_lock = threading.Lock()
+        self._execute_fn_lock = threading.Lock()
         # These are used when in non-threaded mode:
         self._read_connection = None
         self._write_connection = None
@@ -102,10 +103,6 @@ class Database:
                 "Database {!r} has been closed".format(self.name)
             )
 
-    def _remove_pending_execute_future(self, future):
-        with self._pending_execute_futures_lock:
-            self._pending_execute_futures.discard(future)
-
     @property
     def cached_table_counts(self):
         if self._cached_table_counts is not None:
@@ -120,9 +117,14 @@ class Database:
 
     @property
     def color(self):
-        if self.hash:
-            return self.hash[:6]
-        return md5_not_usedforsecurity(self.name)[:6]
+        # Accessed on every page render - cache it, the inputs (name and
+        # content hash for immutable databases) never change
+        if self.cached_color is None:
+            if self.hash:
+                self.cached_color = self.hash[:6]
+            else:
+                self.cached_color = md5_not_usedforsecurity(self.name)[:6]
+        return self.cached_color
 
     def suggest_name(self):
         if self.is_temp_disk:
@@ -147,7 +149,9 @@ class Database:
                 conn.execute("PRAGMA query_only=1")
             return conn
         if self.is_memory:
-            return sqlite3.connect(":memory:", uri=True)
+            # check_same_thread=False so the connection can live in the
+            # read pool and be used from any executor thread
+            return sqlite3.connect(":memory:", uri=True, check_same_thread=False)
 
         # mode=ro or immutable=1?
         if self.is_mutable:
@@ -165,6 +169,11 @@ class Database:
             f"file:{self.path}{qs}", uri=True, check_same_thread=False, **extra_kwargs
         )
         self._all_file_connections.append(conn)
+        if not write and not self.is_mutable:
+            # The file is immutable so SQLite can serve reads straight from
+            # a memory-mapped view of it, sharing the OS page cache between
+            # all pooled connections
+            conn.execute("PRAGMA mmap_size=1073741824")
         if self.is_temp_disk and not self._wal_enabled:
             conn.execute("PRAGMA journal_mode=WAL")
             self._wal_enabled = True
@@ -178,11 +187,10 @@ class Database:
         """
         if self._closed:
             return
-        with self._pending_execute_futures_lock:
+        with self._execute_fn_lock:
             if self._closed:
                 return
             self._closed = True
-            pending_execute_futures = tuple(self._pending_execute_futures)
         # Shut down the write thread, if any, via a sentinel. The thread
         # drains any writes already queued before the sentinel and then
         # closes its own write connection and returns.
@@ -197,11 +205,21 @@ class Database:
                     )
                 )
                 sys.stderr.flush()
-        for future in pending_execute_futures:
-            try:
-                future.result()
-            except Exception:
-                pass
+        # Shut down the read worker threads the same way - the queue is
+        # FIFO, so any reads already queued are delivered before each
+        # worker reaches its sentinel.
+        if self._read_threads and self._read_queue is not None:
+            for _ in self._read_threads:
+                self._read_queue.put(_SHUTDOWN)
+            for read_thread in self._read_threads:
+                read_thread.join(timeout=10)
+                if read_thread.is_alive():
+                    sys.stderr.write(
+                        "Datasette: read thread for {!r} did not exit within 10s\n".format(
+                            self.name
+                        )
+                    )
+                    sys.stderr.flush()
         # Close anything still tracked in _all_file_connections
         for connection in self._all_file_connections:
             try:
@@ -209,11 +227,16 @@ class Database:
             except Exception:
                 pass
         self._all_file_connections = []
-        # Drop per-thread cached read connections we can reach
-        try:
-            delattr(connections, self._thread_local_id)
-        except AttributeError:
-            pass
+        # Drain and close any pooled read connections
+        while True:
+            try:
+                connection = self._read_pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                connection.close()
+            except Exception:
+                pass
         # Close non-threaded-mode cached connections if still open
         if self._read_connection is not None:
             try:
@@ -495,21 +518,48 @@ class Database:
                 self.ds._prepare_connection(self._read_connection, self.name)
             return fn(self._read_connection)
 
-        # threaded mode
-        def in_thread():
-            conn = getattr(connections, self._thread_local_id, None)
-            if not conn:
-                conn = self.connect()
-                self.ds._prepare_connection(conn, self.name)
-                setattr(connections, self._thread_local_id, conn)
-            return fn(conn)
-
-        with self._pending_execute_futures_lock:
+        # Threaded mode - send to a read worker thread
+        loop = asyncio.get_running_loop()
+        reply_future = loop.create_future()
+        with self._execute_fn_lock:
             self._check_not_closed()
-            future = self.ds.executor.submit(in_thread)
-            self._pending_execute_futures.add(future)
-        future.add_done_callback(self._remove_pending_execute_future)
-        return await asyncio.wrap_future(future)
+            if self._read_queue is None:
+                self._read_queue = queue.Queue()
+            if not self._read_threads:
+                self._start_read_threads()
+            self._read_queue.put(ReadTask(fn, loop, reply_future))
+        return await reply_future
+
+    def _start_read_threads(self):
+        num_threads = self.ds.setting("num_sql_threads")
+        for i in range(num_threads):
+            read_thread = threading.Thread(target=self._execute_reads, daemon=True)
+            read_thread.name = "_execute_reads-{} for database {}".format(i, self.name)
+            read_thread.start()
+            self._read_threads.append(read_thread)
+
+    def _execute_reads(self):
+        # Long-lived worker thread that services read queries using
+        # connections checked out of the read pool
+        while True:
+            task = self._read_queue.get()
+            if task is _SHUTDOWN:
+                return
+            result = None
+            exception = None
+            try:
+                try:
+                    conn = self._read_pool.get_nowait()
+                except queue.Empty:
+                    conn = self.connect()
+                    self.ds._prepare_connection(conn, self.name)
+                try:
+                    result = task.fn(conn)
+                finally:
+                    self._read_pool.put(conn)
+            except Exception as e:
+                exception = e
+            _deliver_write_result(task, result, exception)
 
     async def execute(
         self,
@@ -539,7 +589,10 @@ class Database:
                     if max_returned_rows and truncate:
                         rows = cursor.fetchmany(max_returned_rows + 1)
                         truncated = len(rows) > max_returned_rows
-                        rows = rows[:max_returned_rows]
+                        if truncated:
+                            # Trim in place - a slice would copy the
+                            # whole list even when nothing was truncated
+                            del rows[max_returned_rows:]
                     else:
                         rows = cursor.fetchall()
                         truncated = False
@@ -848,6 +901,15 @@ def _apply_write_wrapper(fn, wrapper_factory, track_event):
     return wrapped
 
 
+class ReadTask:
+    __slots__ = ("fn", "loop", "reply_future")
+
+    def __init__(self, fn, loop, reply_future):
+        self.fn = fn
+        self.loop = loop
+        self.reply_future = reply_future
+
+
 class WriteTask:
     __slots__ = (
         "fn",
@@ -870,8 +932,8 @@ class WriteTask:
 
 
 def _deliver_write_result(task, result, exception):
-    # Called from the write thread. Delivers the result back to the
-    # awaiting coroutine on its event loop via call_soon_threadsafe.
+    # Called from a read or write worker thread. Delivers the result back
+    # to the awaiting coroutine on its event loop via call_soon_threadsafe.
     def _set():
         if task.reply_future.done():
             # Awaiter was cancelled; nothing to do.
@@ -945,10 +1007,13 @@ class Results:
         self.rows = rows
         self.truncated = truncated
         self.description = description
+        self._columns = None
 
     @property
     def columns(self):
-        return [d[0] for d in self.description]
+        if self._columns is None:
+            self._columns = [d[0] for d in self.description]
+        return self._columns
 
     def first(self):
         if self.rows:
@@ -60,7 +60,7 @@ def handle_exception(datasette, request, exception):
             return Response.json(info, status=status, headers=headers)
         else:
             environment = datasette.get_jinja_environment(request)
-            template = environment.select_template(templates)
+            template = datasette._select_template(environment, templates)
             return Response.html(
                 await template.render_async(
                     dict(
@@ -1,4 +1,5 @@
 import hashlib
+import mmap
 
 from .utils import (
     detect_spatialite,
@@ -10,20 +11,22 @@ from .utils import (
     sqlite3,
 )
 
-HASH_BLOCK_SIZE = 1024 * 1024
-
 
 def inspect_hash(path):
     """Calculate the hash of a database, efficiently."""
-    m = hashlib.sha256()
     with path.open("rb") as fp:
-        while True:
-            data = fp.read(HASH_BLOCK_SIZE)
-            if not data:
-                break
-            m.update(data)
-
-    return m.hexdigest()
+        try:
+            # Python 3.11+ - hashes in C without copying the file
+            # through Python-level chunks
+            return hashlib.file_digest(fp, "sha256").hexdigest()
+        except AttributeError:
+            pass
+        try:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except ValueError:
+            # Cannot mmap an empty file
+            return hashlib.sha256(fp.read()).hexdigest()
 
 
 def inspect_views(conn):
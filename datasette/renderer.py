@@ -1,4 +1,10 @@
 import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from datasette.extras import extra_names_from_request
 from datasette.utils import (
     value_as_boolean,
@@ -9,21 +15,43 @@ from datasette.utils import (
 )
 from datasette.utils.asgi import Response
 
+_custom_encoder = CustomJSONEncoder()
+
+
+def _orjson_default(obj):
+    # Delegate anything orjson cannot serialize natively (sqlite3.Row,
+    # bytes etc) to CustomJSONEncoder so both code paths produce the
+    # same output
+    return _custom_encoder.default(obj)
+
+
+def json_dumps(data, allow_infinity=False):
+    """Serialize data to a JSON string or bytes, using orjson if available
+
+    allow_infinity=True requires the stdlib encoder - orjson has no
+    equivalent of the Infinity/-Infinity extension to JSON.
+    """
+    if orjson is not None and not allow_infinity:
+        return orjson.dumps(
+            data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, cls=CustomJSONEncoder)
+
 
 def convert_specific_columns_to_json(rows, columns, json_cols):
     json_cols = set(json_cols)
     if not json_cols.intersection(columns):
         return rows
+    # Only the affected column indexes need touching, not every cell
+    indexes = [i for i, column in enumerate(columns) if column in json_cols]
     new_rows = []
     for row in rows:
-        new_row = []
-        for value, column in zip(row, columns):
-            if column in json_cols:
-                try:
-                    value = json.loads(value)
-                except (TypeError, ValueError):
-                    pass
-            new_row.append(value)
+        new_row = list(row)
+        for i in indexes:
+            try:
+                new_row[i] = json.loads(new_row[i])
+            except (TypeError, ValueError):
+                pass
         new_rows.append(new_row)
     return new_rows
 
@@ -32,17 +60,28 @@ def json_renderer(request, args, data, error, truncated=None):
     """Render a response as JSON"""
     status_code = 200
 
+    # "columns" is only present in data if requested as an extra, but the
+    # sqlite3.Row objects know their own column names
+    columns = data.get("columns")
+    if (
+        columns is None
+        and data.get("rows")
+        and isinstance(data["rows"][0], sqlite3.Row)
+    ):
+        columns = data["rows"][0].keys()
+
     # Handle the _json= parameter which may modify data["rows"]
     json_cols = []
     if "_json" in args:
         json_cols = args.getlist("_json")
-    if json_cols and "rows" in data and "columns" in data:
+    if json_cols and "rows" in data and columns:
         data["rows"] = convert_specific_columns_to_json(
-            data["rows"], data["columns"], json_cols
+            data["rows"], columns, json_cols
         )
 
     # unless _json_infinity=1 requested, replace infinity with None
-    if "rows" in data and not value_as_boolean(args.get("_json_infinity", "0")):
+    json_infinity = value_as_boolean(args.get("_json_infinity", "0"))
+    if "rows" in data and not json_infinity:
         data["rows"] = [remove_infinites(row) for row in data["rows"]]
 
     # Deal with the _shape option
@@ -58,15 +97,13 @@ def json_renderer(request, args, data, error, truncated=None):
     if truncated is not None:
         data["truncated"] = truncated
     if shape == "arrayfirst":
-        if not data["rows"]:
-            data = []
-        elif isinstance(data["rows"][0], sqlite3.Row):
-            data = [row[0] for row in data["rows"]]
-        else:
-            assert isinstance(data["rows"][0], dict)
-            data = [next(iter(row.values())) for row in data["rows"]]
+        # Decided per row because remove_infinites() can leave a mix of
+        # sqlite3.Row objects and plain lists
+        data = [
+            next(iter(row.values())) if isinstance(row, dict) else row[0]
+            for row in data["rows"]
+        ]
     elif shape in ("objects", "object", "array"):
-        columns = data.get("columns")
         rows = data.get("rows")
         if rows and columns and not isinstance(rows[0], dict):
             data["rows"] = [dict(zip(columns, row)) for row in rows]
@@ -92,12 +129,14 @@ def json_renderer(request, args, data, error, truncated=None):
             data = data["rows"]
 
     elif shape == "arrays":
-        if not data["rows"]:
-            pass
-        elif isinstance(data["rows"][0], sqlite3.Row):
-            data["rows"] = [list(row) for row in data["rows"]]
-        else:
-            data["rows"] = [list(row.values()) for row in data["rows"]]
+        # tuple(row) is a straight copy of the values a sqlite3.Row (or
+        # list) already holds - much cheaper than building a dict first.
+        # Decided per row because remove_infinites() can leave a mix of
+        # sqlite3.Row objects and plain lists
+        data["rows"] = [
+            tuple(row.values()) if isinstance(row, dict) else tuple(row)
+            for row in data["rows"]
+        ]
     else:
         status_code = 400
         data = {
@@ -115,10 +154,14 @@ def json_renderer(request, args, data, error, truncated=None):
     # Handle _nl option for _shape=array
     nl = args.get("_nl", "")
     if nl and shape == "array":
-        body = "\n".join(json.dumps(item, cls=CustomJSONEncoder) for item in data)
+        items = [json_dumps(item, allow_infinity=json_infinity) for item in data]
+        if items and isinstance(items[0], bytes):
+            body = b"\n".join(items)
+        else:
+            body = "\n".join(items)
         content_type = "text/plain"
     else:
-        body = json.dumps(data, cls=CustomJSONEncoder)
+        body = json_dumps(data, allow_infinity=json_infinity)
         content_type = "application/json; charset=utf-8"
     headers = {}
     return Response(
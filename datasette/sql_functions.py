@@ -4,4 +4,4 @@ from datasette.utils import escape_fts
 
 @hookimpl
 def prepare_connection(conn):
-    conn.create_function("escape_fts", 1, escape_fts)
+    conn.create_function("escape_fts", 1, escape_fts, deterministic=True)
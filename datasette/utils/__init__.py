@@ -5,6 +5,7 @@ import click
 from collections import OrderedDict, namedtuple, Counter
 import copy
 import dataclasses
+import functools
 import base64
 import hashlib
 import inspect
@@ -268,7 +269,8 @@ class CustomJSONEncoder(json.JSONEncoder):
 
 @contextmanager
 def sqlite_timelimit(conn, ms):
-    deadline = time.perf_counter() + (ms / 1000)
+    # Integer nanoseconds, so the handler below does no float arithmetic
+    deadline = time.perf_counter_ns() + (ms * 1_000_000)
     # n is the number of SQLite virtual machine instructions that will be
     # executed between each check. It takes about 0.08ms to execute 1000.
     # https://github.com/simonw/datasette/issues/1679
@@ -278,7 +280,7 @@ def sqlite_timelimit(conn, ms):
         n = 1
 
     def handler():
-        if time.perf_counter() >= deadline:
+        if time.perf_counter_ns() >= deadline:
             # Returning 1 terminates the query with an error
             return 1
 
@@ -431,7 +433,10 @@ def escape_css_string(s):
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def escape_sqlite(s):
+    # Cached - the same table and column names are escaped over and over
+    # again while building SQL for every request
     if _boring_keyword_re.match(s) and (s.lower() not in reserved_words):
         return s
     return '"{}"'.format(s.replace('"', '""'))
@@ -1277,13 +1282,16 @@ def named_parameters(sql: str) -> List[str]:
     Given a SQL statement, return a list of named parameters that are used in the statement
 
     e.g. for ``select * from foo where id=:id`` this would return ``["id"]``
+
+    Parameters that are used more than once are returned just once, in the
+    order they first appear.
     """
     sql = _single_line_comment_re.sub("", sql)
     sql = _multi_line_comment_re.sub("", sql)
     sql = _single_quote_re.sub("", sql)
     sql = _double_quote_re.sub("", sql)
-    # Extract parameters from what is left
-    return _named_param_re.findall(sql)
+    # Extract parameters from what is left, de-duplicated but in order
+    return list(dict.fromkeys(_named_param_re.findall(sql)))
 
 
 async def derive_named_parameters(db: "Database", sql: str) -> List[str]:
@@ -1329,16 +1337,24 @@ class TildeEncoder(dict):
 
 _tilde_encoder = TildeEncoder().__getitem__
 
+_tilde_encoding_safe_re = re.compile(r"^[A-Za-z0-9_-]*$")
+
 
 @documented
 def tilde_encode(s: str) -> str:
     "Returns tilde-encoded string - for example ``/foo/bar`` -> ``~2Ffoo~2Fbar``"
+    # Common case: nothing needs encoding, skip the byte-by-byte walk
+    if _tilde_encoding_safe_re.match(s):
+        return s
     return "".join(_tilde_encoder(char) for char in s.encode("utf-8"))
 
 
 @documented
 def tilde_decode(s: str) -> str:
     "Decodes a tilde-encoded string, so ``~2Ffoo~2Fbar`` -> ``/foo/bar``"
+    # Common case: nothing needs decoding
+    if "~" not in s and "+" not in s:
+        return s
     # Avoid accidentally decoding a %2f style sequence
     temp = secrets.token_hex(16)
     s = s.replace("%", temp)
@@ -74,6 +74,8 @@ class Request:
     def __init__(self, scope, receive):
         self.scope = scope
         self.receive = receive
+        # Cache of (query_string, MultiParams) for the .args property
+        self._parsed_args = None
 
     def __repr__(self):
         return '<asgi.Request method="{}" url="{}">'.format(self.method, self.url)
@@ -135,7 +137,18 @@ class Request:
 
     @property
     def args(self):
-        return MultiParams(parse_qs(qs=self.query_string, keep_blank_values=True))
+        # Parsing the query string is not free and .args is accessed many
+        # times per request, so cache the result - keyed on the query
+        # string in case the scope is modified
+        query_string = self.query_string
+        cached = self._parsed_args
+        if cached is None or cached[0] != query_string:
+            cached = (
+                query_string,
+                MultiParams(parse_qs(qs=query_string, keep_blank_values=True)),
+            )
+            self._parsed_args = cached
+        return cached[1]
 
     @property
     def actor(self):
@@ -447,6 +460,13 @@ def asgi_static(root_path, chunk_size=4096, headers=None, content_type=None):
     return inner_static
 
 
+# Response bodies larger than this are sent in multiple ASGI messages,
+# so the server can put the first bytes on the wire (and the client can
+# start parsing) without a single copy of the whole payload being
+# buffered into one send
+RESPONSE_CHUNK_SIZE = 1024 * 1024
+
+
 class Response:
     def __init__(self, body=None, status=200, headers=None, content_type="text/plain"):
         self.body = body
@@ -475,7 +495,18 @@ class Response:
         body = self.body
         if not isinstance(body, bytes):
             body = body.encode("utf-8")
-        await send({"type": "http.response.body", "body": body})
+        if len(body) > RESPONSE_CHUNK_SIZE:
+            for i in range(0, len(body), RESPONSE_CHUNK_SIZE):
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": body[i : i + RESPONSE_CHUNK_SIZE],
+                        "more_body": True,
+                    }
+                )
+            await send({"type": "http.response.body", "body": b""})
+        else:
+            await send({"type": "http.response.body", "body": body})
 
     def set_cookie(
         self,
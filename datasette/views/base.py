@@ -127,7 +127,7 @@ class BaseView:
     async def render(self, templates, request, context=None):
         context = context or {}
         environment = self.ds.get_jinja_environment(request)
-        template = environment.select_template(templates)
+        template = self.ds._select_template(environment, templates)
         template_context = {
             **context,
             **{
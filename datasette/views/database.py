@@ -224,7 +224,7 @@ class DatabaseView(View):
         )
         templates = (f"database-{to_css_class(database)}.html", "database.html")
         environment = datasette.get_jinja_environment(request)
-        template = environment.select_template(templates)
+        template = datasette._select_template(environment, templates)
         return Response.html(
             await datasette.render_template(
                 templates,
@@ -494,22 +494,43 @@ async def get_tables(datasette, request, db, allowed_dict) -> list[DatabaseTable
     hidden_table_names = set(await db.hidden_table_names())
     all_foreign_keys = await db.get_all_foreign_keys()
 
-    for table in table_counts:
-        if table not in allowed_dict:
-            continue
-
-        table_columns = await db.table_columns(table)
+    table_names = [table for table in table_counts if table in allowed_dict]
+    if db.is_memory:
+        # Parallel queries against in-memory databases cause locking
+        # issues: https://github.com/simonw/datasette/issues/2189
+        details = [
+            (
+                await db.table_columns(table),
+                await db.primary_keys(table),
+                await db.fts_table(table),
+            )
+            for table in table_names
+        ]
+    else:
+        # Fire the per-table lookups concurrently so the read workers can
+        # service them in parallel, instead of one thread hop per query
+        details = await asyncio.gather(
+            *(
+                asyncio.gather(
+                    db.table_columns(table),
+                    db.primary_keys(table),
+                    db.fts_table(table),
+                )
+                for table in table_names
+            )
+        )
+    for table, (table_columns, primary_keys, fts_table) in zip(table_names, details):
         tables.append(
             DatabaseTable(
                 name=table,
                 columns=table_columns,
-                primary_keys=await db.primary_keys(table),
+                primary_keys=primary_keys,
                 count=table_counts[table],
                 count_truncated=_table_count_truncated(
                     datasette, db, table, table_counts[table]
                 ),
                 hidden=table in hidden_table_names,
-                fts_table=await db.fts_table(table),
+                fts_table=fts_table,
                 foreign_keys=all_foreign_keys[table],
                 private=allowed_dict[table].private,
             )
@@ -915,7 +936,7 @@ class QueryView(View):
                 )
 
             environment = datasette.get_jinja_environment(request)
-            template = environment.select_template(templates)
+            template = datasette._select_template(environment, templates)
             alternate_url_json = datasette.absolute_url(
                 request,
                 datasette.urls.path(
@@ -166,7 +166,7 @@ class RowView(BaseView):
             data_kwargs["default_labels"] = True
 
         extra_template_data = {}
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         status_code = None
         templates = ()
         try:
@@ -206,8 +206,8 @@ class RowView(BaseView):
         except DatasetteError:
             raise
 
-        end = time.perf_counter()
-        data["query_ms"] = (end - start) * 1000
+        end = time.perf_counter_ns()
+        data["query_ms"] = (end - start) / 1_000_000
 
         # Special case for .jsono extension - redirect to _shape=objects
         if format_ == "jsono":
@@ -325,7 +325,7 @@ class RowView(BaseView):
             context["metadata"] = await self.ds.get_instance_metadata()
 
         environment = self.ds.get_jinja_environment(request)
-        template = environment.select_template(templates)
+        template = self.ds._select_template(environment, templates)
         alternate_url_json = self.ds.absolute_url(
             request,
             self.ds.urls.path(
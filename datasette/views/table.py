@@ -220,6 +220,30 @@ LINK_WITH_LABEL = (
 )
 LINK_WITH_VALUE = '<a href="{base_url}{database}/{table}/{link_id}">{id}</a>'
 
+EDIT_ROW_ICON = (
+    '<svg class="row-inline-action-icon" aria-hidden="true" '
+    'xmlns="http://www.w3.org/2000/svg" width="14" height="14" '
+    'viewBox="0 0 24 24" fill="none" stroke="currentColor" '
+    'stroke-width="2" stroke-linecap="round" stroke-linejoin="round">'
+    '<path d="M11 4H4a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7"></path>'
+    '<path d="M18.5 2.5a2.12 2.12 0 0 1 3 3L12 15l-4 1 1-4 9.5-9.5z"></path>'
+    "</svg>"
+)
+DELETE_ROW_ICON = (
+    '<svg class="row-inline-action-icon" aria-hidden="true" '
+    'xmlns="http://www.w3.org/2000/svg" width="14" height="14" '
+    'viewBox="0 0 24 24" fill="none" stroke="currentColor" '
+    'stroke-width="2" stroke-linecap="round" stroke-linejoin="round">'
+    '<path d="M3 6h18"></path>'
+    '<path d="M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"></path>'
+    '<path d="M19 6l-1 14a2 2 0 0 1-2 2H8a2 2 0 0 1-2-2L5 6"></path>'
+    '<path d="M10 11v6"></path>'
+    '<path d="M14 11v6"></path>'
+    "</svg>"
+)
+
+EMPTY_CELL = markupsafe.Markup("&nbsp;")
+
 
 class Row:
     def __init__(
@@ -620,34 +644,32 @@ async def display_columns_and_rows(
     """Returns columns, rows for specified table - including fancy foreign key treatment"""
     sortable_columns = sortable_columns or set()
     db = datasette.databases[database_name]
-    column_descriptions = dict(
-        await datasette.get_internal_database().execute(
-            """
-          SELECT
-            column_name,
-            value
-          FROM metadata_columns
-          WHERE database_name = ?
-            AND resource_name = ?
-            AND key = 'description'
-        """,
-            [database_name, table_name],
-        )
+    # These lookups run sequentially, not via asyncio.gather() - parallel
+    # queries cause locking issues with in-memory databases, and several
+    # of these touch the (in-memory) internal database:
+    # https://github.com/simonw/datasette/issues/2189
+    column_description_rows = await datasette.get_internal_database().execute(
+        """
+      SELECT
+        column_name,
+        value
+      FROM metadata_columns
+      WHERE database_name = ?
+        AND resource_name = ?
+        AND key = 'description'
+    """,
+        [database_name, table_name],
     )
-
-    # Look up column types for this table
     column_types_map = await datasette.get_column_types(database_name, table_name)
-
-    column_details = {
-        col.name: col for col in await db.table_column_details(table_name)
-    }
+    column_details_list = await db.table_column_details(table_name)
     pks = await db.primary_keys(table_name)
+    foreign_keys = await db.foreign_keys_for_table(table_name)
+    label_column = await db.label_column_for_table(table_name) if link_column else None
+    column_descriptions = dict(column_description_rows)
+    column_details = {col.name: col for col in column_details_list}
     pks_for_display = pks
     if not pks_for_display:
         pks_for_display = ["rowid"]
-    label_column = None
-    if link_column:
-        label_column = await db.label_column_for_table(table_name)
     row_action_permissions = {}
     if link_column and request is not None and db.is_mutable:
         row_action_permissions = await datasette.allowed_many(
@@ -680,70 +702,57 @@ async def display_columns_and_rows(
             col_dict["column_type_config"] = ct.config
         columns.append(col_dict)
 
-    column_to_foreign_key_table = {
-        fk["column"]: fk["other_table"]
-        for fk in await db.foreign_keys_for_table(table_name)
+    # The table each foreign key column links to, tilde-encoded once here
+    # rather than once per cell in the loop below
+    column_to_fk_table_encoded = {
+        fk["column"]: tilde_encode(fk["other_table"]) for fk in foreign_keys
     }
 
     cell_rows = []
     base_url = datasette.setting("base_url")
+    # Invariants for the row loop below
+    table_path = datasette.urls.table(database_name, table_name)
+    can_update_row = row_action_permissions.get("update-row")
+    can_delete_row = row_action_permissions.get("delete-row")
+    database_encoded = tilde_encode(database_name)
+    is_special_link_column = len(pks) != 1
+    link_column_name = pks[0] if len(pks) == 1 else "Link"
+    use_rowid = not pks
+    column_types = [column_types_map.get(c["name"]) for c in columns]
     for row in rows:
         cells = []
         # Unless we are a view, the first column is a link - either to the rowid
         # or to the simple or compound primary key
         if link_column:
-            is_special_link_column = len(pks) != 1
-            pk_path = path_from_row_pks(row, pks, not pks, False)
-            row_path = path_from_row_pks(row, pks, not pks)
+            pk_path = path_from_row_pks(row, pks, use_rowid, False)
+            row_path = path_from_row_pks(row, pks, use_rowid)
             row_label = row_label_from_label_column(row, label_column)
             row_action_label = pk_path
             if row_label and row_label != pk_path:
                 row_action_label = "{} {}".format(pk_path, row_label)
-            table_path = datasette.urls.table(database_name, table_name)
             row_link = '<a href="{table_path}/{flat_pks_quoted}">{flat_pks}</a>'.format(
                 table_path=table_path,
                 flat_pks=str(markupsafe.escape(pk_path)),
                 flat_pks_quoted=row_path,
             )
-            edit_icon = (
-                '<svg class="row-inline-action-icon" aria-hidden="true" '
-                'xmlns="http://www.w3.org/2000/svg" width="14" height="14" '
-                'viewBox="0 0 24 24" fill="none" stroke="currentColor" '
-                'stroke-width="2" stroke-linecap="round" stroke-linejoin="round">'
-                '<path d="M11 4H4a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7"></path>'
-                '<path d="M18.5 2.5a2.12 2.12 0 0 1 3 3L12 15l-4 1 1-4 9.5-9.5z"></path>'
-                "</svg>"
-            )
-            delete_icon = (
-                '<svg class="row-inline-action-icon" aria-hidden="true" '
-                'xmlns="http://www.w3.org/2000/svg" width="14" height="14" '
-                'viewBox="0 0 24 24" fill="none" stroke="currentColor" '
-                'stroke-width="2" stroke-linecap="round" stroke-linejoin="round">'
-                '<path d="M3 6h18"></path>'
-                '<path d="M8 6V4a2 2 0 0 1 2-2h4a2 2 0 0 1 2 2v2"></path>'
-                '<path d="M19 6l-1 14a2 2 0 0 1-2 2H8a2 2 0 0 1-2-2L5 6"></path>'
-                '<path d="M10 11v6"></path>'
-                '<path d="M14 11v6"></path>'
-                "</svg>"
-            )
             row_actions = []
-            if row_action_permissions.get("update-row"):
+            if can_update_row:
                 row_actions.append(
                     '<button type="button" class="row-inline-action row-inline-action-edit" '
                     'aria-label="Edit row {row_label}" title="Edit row" '
                     'data-row-action="edit">'
                     "{edit_icon}</button>".format(
-                        edit_icon=edit_icon,
+                        edit_icon=EDIT_ROW_ICON,
                         row_label=markupsafe.escape(row_action_label),
                     )
                 )
-            if row_action_permissions.get("delete-row"):
+            if can_delete_row:
                 row_actions.append(
                     '<button type="button" class="row-inline-action row-inline-action-delete" '
                     'aria-label="Delete row {row_label}" title="Delete row" '
                     'data-row-action="delete">'
                     "{delete_icon}</button>".format(
-                        delete_icon=delete_icon,
+                        delete_icon=DELETE_ROW_ICON,
                         row_label=markupsafe.escape(row_action_label),
                     )
                 )
@@ -755,7 +764,7 @@ async def display_columns_and_rows(
                 ).format(row_link=row_link, row_actions="".join(row_actions))
             cells.append(
                 {
-                    "column": pks[0] if len(pks) == 1 else "Link",
+                    "column": link_column_name,
                     "value_type": "pk",
                     "is_special_link_column": is_special_link_column,
                     "raw": pk_path,
@@ -763,7 +772,7 @@ async def display_columns_and_rows(
                 }
             )
 
-        for value, column_dict in zip(row, columns):
+        for value, column_dict, ct in zip(row, columns, column_types):
             column = column_dict["name"]
             if link_column and len(pks) == 1 and column == pks[0]:
                 # If there's a simple primary key, don't repeat the value as it's
@@ -773,7 +782,6 @@ async def display_columns_and_rows(
             # First try column type render_cell, then plugins
             # pylint: disable=no-member
             plugin_display_value = None
-            ct = column_types_map.get(column)
             if ct:
                 candidate = await ct.render_cell(
                     value=value,
@@ -810,7 +818,7 @@ async def display_columns_and_rows(
                         datasette.urls.row_blob(
                             database_name,
                             table_name,
-                            path_from_row_pks(row, pks, not pks),
+                            path_from_row_pks(row, pks, use_rowid),
                             column,
                         ),
                         (
@@ -826,21 +834,20 @@ async def display_columns_and_rows(
                 # It's an expanded foreign key - display link to other row
                 label = value["label"]
                 value = value["value"]
-                # The table we link to depends on the column
-                other_table = column_to_foreign_key_table[column]
                 link_template = LINK_WITH_LABEL if (label != value) else LINK_WITH_VALUE
                 display_value = markupsafe.Markup(
                     link_template.format(
-                        database=tilde_encode(database_name),
+                        database=database_encoded,
                         base_url=base_url,
-                        table=tilde_encode(other_table),
+                        # The table we link to depends on the column
+                        table=column_to_fk_table_encoded[column],
                         link_id=tilde_encode(str(value)),
                         id=str(markupsafe.escape(value)),
                         label=str(markupsafe.escape(label)) or "-",
                     )
                 )
             elif value in ("", None):
-                display_value = markupsafe.Markup("&nbsp;")
+                display_value = EMPTY_CELL
             elif is_url(str(value).strip()):
                 display_value = markupsafe.Markup(
                     '<a href="{url}">{truncated_url}</a>'.format(
@@ -1807,7 +1814,7 @@ async def table_view_traced(datasette, request):
             "table.html",
         ]
         environment = datasette.get_jinja_environment(request)
-        template = environment.select_template(templates)
+        template = datasette._select_template(environment, templates)
         alternate_url_json = datasette.absolute_url(
             request,
             datasette.urls.path(
@@ -2320,16 +2327,21 @@ async def table_view_data(
     raw_sqlite_rows = rows[:page_size]
     # Apply transform_value for columns with assigned types
     ct_map = await datasette.get_column_types(database_name, table_name)
-    transformed_rows = []
-    for r in raw_sqlite_rows:
-        row_dict = dict(r)
-        for col_name, ct in ct_map.items():
-            if col_name in row_dict:
-                row_dict[col_name] = await ct.transform_value(
-                    row_dict[col_name], datasette
-                )
-        transformed_rows.append(row_dict)
-    data["rows"] = transformed_rows
+    if ct_map:
+        transformed_rows = []
+        for r in raw_sqlite_rows:
+            row_dict = dict(r)
+            for col_name, ct in ct_map.items():
+                if col_name in row_dict:
+                    row_dict[col_name] = await ct.transform_value(
+                        row_dict[col_name], datasette
+                    )
+            transformed_rows.append(row_dict)
+        data["rows"] = transformed_rows
+    else:
+        # No column types assigned - pass the sqlite3.Row objects straight
+        # through, the renderer converts them to the requested shape
+        data["rows"] = list(raw_sqlite_rows)
 
     if context_for_html_hack:
         data["count_truncated"] = _count_truncated_for_table_page(
@@ -2405,10 +2417,12 @@ def _count_truncated_for_table_page(
 ):
     if count != db.count_limit + 1:
         return False
+    # Only counts recorded at inspect time are known to be exact - counts
+    # cached at runtime by table_counts() are capped at count_limit + 1
     if (
         not db.is_mutable
         and datasette.inspect_data
-        and count_sql == f"select count(*) from {table_name} "
+        and count_sql == f"select count(*) from {escape_sqlite(table_name)} "
     ):
         try:
             datasette.inspect_data[database_name]["tables"][table_name]["count"]
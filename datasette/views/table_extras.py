@@ -8,6 +8,7 @@ from datasette.resources import DatabaseResource, TableResource
 from datasette.utils import (
     await_me_maybe,
     call_with_supported_arguments,
+    escape_sqlite,
     path_with_added_args,
     path_with_format,
     path_with_removed_args,
@@ -114,10 +115,16 @@ class CountExtra(Extra):
 
     async def resolve(self, context):
         count = None
+        # An unfiltered count of an immutable table can be answered from the
+        # exact counts recorded at inspect time. count_sql is built with
+        # escape_sqlite() so compare against the escaped name. Counts cached
+        # at runtime by table_counts() are deliberately not used here - they
+        # are capped at count_limit + 1, so not guaranteed exact.
         if (
             not context.db.is_mutable
             and context.datasette.inspect_data
-            and context.count_sql == f"select count(*) from {context.table_name} "
+            and context.count_sql
+            == f"select count(*) from {escape_sqlite(context.table_name)} "
         ):
             try:
                 count = context.datasette.inspect_data[context.database_name]["tables"][
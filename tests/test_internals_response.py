@@ -52,3 +52,23 @@ async def test_response_set_cookie():
         },
         {"type": "http.response.body", "body": b""},
     ] == events
+
+
+@pytest.mark.asyncio
+async def test_response_large_body_sent_in_chunks():
+    from datasette.utils.asgi import RESPONSE_CHUNK_SIZE
+
+    events = []
+
+    async def send(event):
+        events.append(event)
+
+    body = b"x" * (RESPONSE_CHUNK_SIZE * 2 + 100)
+    response = Response(body, content_type="application/json")
+    await response.asgi_send(send)
+
+    body_events = [e for e in events if e["type"] == "http.response.body"]
+    assert len(body_events) == 4
+    assert all(e.get("more_body") for e in body_events[:-1])
+    assert body_events[-1] == {"type": "http.response.body", "body": b""}
+    assert b"".join(e["body"] for e in body_events) == body
@@ -1258,6 +1258,26 @@ async def test_infinity_returned_as_null(ds_client):
     ]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "shape,expected",
+    [
+        ("arrays", {"rows": [[1, None], [2, None], [3, 1.5]]}),
+        ("arrayfirst", [1, 2, 3]),
+    ],
+)
+async def test_infinity_with_array_shapes(ds_client, shape, expected):
+    # Mixed sqlite3.Row and list rows after infinity replacement should
+    # not break the positional shapes
+    response = await ds_client.get(f"/fixtures/infinity.json?_shape={shape}")
+    assert response.status_code == 200
+    data = response.json()
+    if isinstance(expected, dict):
+        assert data["rows"] == expected["rows"]
+    else:
+        assert data == expected
+
+
 @pytest.mark.asyncio
 async def test_infinity_returned_as_invalid_json_if_requested(ds_client):
     response = await ds_client.get(
@@ -1306,7 +1326,7 @@ async def test_null_and_compound_foreign_keys_are_not_expanded(ds_client):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    "path,expected_json,expected_text",
+    "path,expected_json,expected_lines",
     [
         (
             "/fixtures/binary_data.json?_shape=array",
@@ -1320,20 +1340,24 @@ async def test_null_and_compound_foreign_keys_are_not_expanded(ds_client):
         (
             "/fixtures/binary_data.json?_shape=array&_nl=on",
             None,
-            (
-                '{"rowid": 1, "data": {"$base64": true, "encoded": "FRwCx60F/g=="}}\n'
-                '{"rowid": 2, "data": {"$base64": true, "encoded": "FRwDx60F/g=="}}\n'
-                '{"rowid": 3, "data": null}'
-            ),
+            [
+                {"rowid": 1, "data": {"$base64": True, "encoded": "FRwCx60F/g=="}},
+                {"rowid": 2, "data": {"$base64": True, "encoded": "FRwDx60F/g=="}},
+                {"rowid": 3, "data": None},
+            ],
         ),
     ],
 )
-async def test_binary_data_in_json(ds_client, path, expected_json, expected_text):
+async def test_binary_data_in_json(ds_client, path, expected_json, expected_lines):
     response = await ds_client.get(path)
     if expected_json:
         assert response.json() == expected_json
     else:
-        assert response.text == expected_text
+        # Whitespace in the output varies depending on whether orjson
+        # is installed, so compare the parsed lines instead
+        assert [
+            json.loads(line) for line in response.text.split("\n")
+        ] == expected_lines
 
 
 @pytest.mark.asyncio